@@ -4,22 +4,372 @@ Handles all AI-powered features including ATS scoring, interview generation, and
 Uses Grok-3 via XAI API (OpenAI-compatible) with intelligent fallbacks.
 """
 
+import asyncio
+import copy
+import functools
 import os
 import json
+import random
 import re
-from typing import Dict, List, Optional
-from langchain.prompts import ChatPromptTemplate
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional
 from langchain.chat_models import ChatOpenAI
+from langchain.schema import HumanMessage, SystemMessage
+
+# orjson parses the 2-3 KB LLM payloads several times faster than stdlib json;
+# degrade gracefully when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# XAI connection config resolved once at import - no per-call os.environ
+# lookups on the hot path (tests can override these module attributes)
+_XAI_API_KEY = os.getenv("XAI_API_KEY") or os.getenv("OPENAI_API_KEY", "dummy-key")
+_XAI_BASE_URL = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
+_ATS_MAX_CONCURRENCY = int(os.getenv("ATS_CONCURRENCY", "10"))
+
+# Cap concurrent XAI calls so build_full_interview doesn't trip rate limits
+_LLM_SEMAPHORE = asyncio.Semaphore(5)
+
+# Circuit breaker: after _CB_THRESHOLD consecutive XAI call failures, skip
+# the API for _CB_COOLDOWN seconds and serve fallbacks immediately instead
+# of letting every request eat a connect/read timeout
+_CB_THRESHOLD = int(os.getenv("XAI_CB_THRESHOLD", "3"))
+_CB_COOLDOWN = float(os.getenv("XAI_CB_COOLDOWN", "60"))
+_cb_failures = 0
+_cb_open_until = 0.0
+
+
+def _circuit_open() -> bool:
+    return time.monotonic() < _cb_open_until
+
+
+def _record_llm_success():
+    global _cb_failures
+    _cb_failures = 0
+
+
+def _record_llm_failure():
+    global _cb_failures, _cb_open_until
+    _cb_failures += 1
+    if _cb_failures >= _CB_THRESHOLD:
+        _cb_open_until = time.monotonic() + _CB_COOLDOWN
+        _cb_failures = 0
+        print(f"⚠️ XAI circuit opened for {_CB_COOLDOWN:.0f}s after repeated failures")
+
+# Precompiled JSON extraction patterns - these run on every LLM response
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARR_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Keyword tables for the fallback scorer (common technical terms)
+_COMMON_SKILLS = [
+    'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
+    'fastapi', 'django', 'flask', 'express', 'spring',
+    'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
+    'git', 'ci/cd', 'jenkins', 'github actions',
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch',
+    'rest api', 'graphql', 'microservices', 'agile', 'scrum'
+]
+_EXPERIENCE_KEYWORDS = ['years', 'experience', 'led', 'managed', 'developed', 'built', 'designed']
+_EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'degree', 'university', 'computer science']
+
+# Each canonical skill gets one bit, so a text's skill set is a single int
+# and matched/missing reduce to bitwise ops instead of Python set algebra
+_SKILL_TO_BIT = {skill: 1 << i for i, skill in enumerate(_COMMON_SKILLS)}
+
+_KEYWORD_CATEGORY = {
+    **{kw: "skill" for kw in _COMMON_SKILLS},
+    **{kw: "experience" for kw in _EXPERIENCE_KEYWORDS},
+    **{kw: "education" for kw in _EDUCATION_KEYWORDS},
+}
+
+# One alternation regex replaces the per-keyword substring loop in the
+# pure-Python scan path. The zero-width lookahead makes matches
+# overlapping - the engine retries every position, so a keyword starting
+# inside or straddling another match is still found. The only remaining
+# shadow is a keyword that is a *prefix* of a longer one (both start at
+# the same position and the alternation picks the longest), so a hit on
+# the longer keyword implies its prefixes to keep exact `in` semantics.
+_KEYWORD_FALLBACK_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in sorted(_KEYWORD_CATEGORY, key=len, reverse=True)) + '))'
+)
+_KEYWORD_IMPLIES = {
+    longer: [shorter for shorter in _KEYWORD_CATEGORY
+             if shorter != longer and longer.startswith(shorter)]
+    for longer in _KEYWORD_CATEGORY
+}
+_KEYWORD_IMPLIES = {kw: implied for kw, implied in _KEYWORD_IMPLIES.items() if implied}
+
+
+def _skills_from_mask(mask: int) -> List[str]:
+    """Materialize skill names from a bitmask, in canonical list order"""
+    return [_COMMON_SKILLS[i] for i in range(len(_COMMON_SKILLS)) if mask >> i & 1]
+
+
+def _build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over all fallback keywords so each
+    resume/JD is scanned in a single O(N) pass instead of ~40 substring
+    scans. pyahocorasick is optional - returns None when unavailable.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category, keywords in (("skill", _COMMON_SKILLS),
+                               ("experience", _EXPERIENCE_KEYWORDS),
+                               ("education", _EDUCATION_KEYWORDS)):
+        for kw in keywords:
+            automaton.add_word(kw, (category, kw))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_keywords(text_lower: str) -> Dict:
+    """
+    Find all fallback keywords in lowercased text.
+    Skills are returned as a bitmask over _COMMON_SKILLS; experience and
+    education keywords as sets. Results are memoized - batch fallback
+    scoring scans the same JD once instead of once per candidate.
+    """
+    found = {"skill_mask": 0, "experience": set(), "education": set()}
+    if _KEYWORD_AUTOMATON is not None:
+        for _end, (category, kw) in _KEYWORD_AUTOMATON.iter(text_lower):
+            if category == "skill":
+                found["skill_mask"] |= _SKILL_TO_BIT[kw]
+            else:
+                found[category].add(kw)
+    else:
+        # Pure-Python path when pyahocorasick isn't installed:
+        # one overlapping regex pass instead of ~40 substring scans
+        hits = {match.group(1) for match in _KEYWORD_FALLBACK_RE.finditer(text_lower)}
+        for kw in list(hits):
+            hits.update(_KEYWORD_IMPLIES.get(kw, ()))
+        for kw in hits:
+            category = _KEYWORD_CATEGORY[kw]
+            if category == "skill":
+                found["skill_mask"] |= _SKILL_TO_BIT[kw]
+            else:
+                found[category].add(kw)
+    return found
+
+
+def _setup_llm_cache():
+    """
+    Enable LangChain's global LLM cache so identical prompts (e.g. re-scoring
+    the same resume+JD pair) hit a local lookup instead of a Grok API call.
+    Uses Redis when REDIS_URL is set (multi-worker deployments), SQLite otherwise.
+    """
+    try:
+        from langchain.globals import set_llm_cache
+
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            import redis
+            from langchain.cache import RedisCache
+            set_llm_cache(RedisCache(redis.Redis.from_url(redis_url)))
+        else:
+            from langchain.cache import SQLiteCache
+            set_llm_cache(SQLiteCache(database_path=os.getenv("LC_CACHE_PATH", ".talentis_llm_cache.db")))
+    except Exception as e:
+        print(f"⚠️ LLM cache setup failed (continuing without cache): {e}")
+
+
+_setup_llm_cache()
+
+
+def _ttl_cache(ttl_seconds: int = 900, maxsize: int = 128):
+    """
+    In-process TTL cache for the question/problem generators - repeat
+    requests for the same (job, skills, difficulty) within the window skip
+    the LLM round-trip entirely. List arguments are normalized to tuples
+    for hashing, and cached results are deep-copied on the way out because
+    callers renumber the returned question dicts in place.
+    """
+    def decorator(func):
+        cache = {}
+
+        def _freeze(value):
+            return tuple(value) if isinstance(value, list) else value
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (tuple(_freeze(a) for a in args),
+                   tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit and now - hit[0] < ttl_seconds:
+                return copy.deepcopy(hit[1])
+
+            result = func(*args, **kwargs)
+            cache[key] = (now, result)
+            if len(cache) > maxsize:
+                # Evict the stalest entry to keep the cache bounded
+                del cache[min(cache, key=lambda k: cache[k][0])]
+            return copy.deepcopy(result)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# tiktoken gives exact token counts; without it we approximate 4 chars/token
+try:
+    import tiktoken
+    _TOKEN_ENCODER = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _TOKEN_ENCODER = None
+
+# Prompt budgets in tokens (the unit the model and the bill actually use)
+# rather than characters - ~3000/4000/2000 chars at 4 chars per token
+_JD_TOKEN_BUDGET = int(os.getenv("ATS_JD_TOKENS", "750"))
+_RESUME_TOKEN_BUDGET = int(os.getenv("ATS_RESUME_TOKENS", "1000"))
+_BEHAVIORAL_JD_TOKEN_BUDGET = 500
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to a token budget (exact with tiktoken, ~4 chars/token otherwise)"""
+    if _TOKEN_ENCODER is not None:
+        tokens = _TOKEN_ENCODER.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return _TOKEN_ENCODER.decode(tokens[:max_tokens])
+    return text[:max_tokens * 4]
+
+
+def _normalize_text(text: str, max_tokens: int) -> str:
+    """
+    Normalize whitespace and truncate to a token budget before prompt
+    formatting. Caching keys on the full prompt text, so normalized input
+    maximizes hit-rate. The pre-slice bounds the normalization cost for
+    very long inputs; the single regex substitution avoids the word-list
+    intermediate that split()/join() would allocate.
+    """
+    return _truncate_to_tokens(_WHITESPACE_RE.sub(' ', text[:max_tokens * 8]).strip(), max_tokens)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_llm(temperature: float, max_tokens: int, streaming: bool = False, json_mode: bool = False) -> ChatOpenAI:
+    """
+    Build a Grok-3 client via XAI API (OpenAI-compatible).
+    Cached per (temperature, max_tokens, streaming, json_mode) profile so
+    each call site reuses one client - and its warm HTTP connection pool -
+    instead of paying TLS+TCP handshake latency on every request.
+    json_mode sets response_format=json_object so the model returns
+    guaranteed JSON. Tests can repoint _XAI_API_KEY/_XAI_BASE_URL and call
+    _make_llm.cache_clear() to reconfigure.
+    """
+    return ChatOpenAI(
+        model="grok-beta",  # Grok-3 model
+        openai_api_key=_XAI_API_KEY,
+        openai_api_base=_XAI_BASE_URL,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        streaming=streaming,
+        model_kwargs={"response_format": {"type": "json_object"}} if json_mode else {}
+    )
+
+
+# Static system prompts are built once - no template parse/format machinery
+_ATS_SYSTEM_PROMPT = SystemMessage(content="""You are an expert ATS analyzer. Score how well the resume matches the job description, weighing skills, experience, education and domain fit. Be realistic and fair.
+Recommendation bands: 80+ Strong Match, 60-79 Good Match, 40-59 Moderate Match, <40 Weak Match.
+Return ONLY JSON:
+{"score": <int 0-100>, "explanation": "<analysis>", "matched_skills": ["..."], "missing_skills": ["..."], "recommendation": "<Strong Match|Good Match|Moderate Match|Weak Match>"}""")
+
+
+def _ats_messages(resume_text: str, jd_text: str) -> List:
+    """Build the ATS scoring prompt messages (kept token-lean - the prompt is resent on every call)"""
+    return [
+        _ATS_SYSTEM_PROMPT,
+        HumanMessage(content=f"""Job Description:
+{_normalize_text(jd_text, _JD_TOKEN_BUDGET)}
+
+Candidate Resume:
+{_normalize_text(resume_text, _RESUME_TOKEN_BUDGET)}""")
+    ]
+
+
+def _parse_ats_response(result_text: str) -> Dict:
+    """Extract and validate the ATS score JSON from a raw LLM response"""
+    try:
+        # json_mode guarantees a bare JSON object - no extraction needed
+        result = _json_loads(result_text)
+    except ValueError:
+        json_match = _JSON_OBJ_RE.search(result_text)
+        if not json_match:
+            raise ValueError("No JSON found in AI response")
+        result = _json_loads(json_match.group())
+
+    # Validate required fields
+    required_fields = ['score', 'explanation', 'matched_skills', 'missing_skills', 'recommendation']
+    if not all(field in result for field in required_fields):
+        raise ValueError("Missing required fields in AI response")
+
+    # Ensure score is within bounds
+    result['score'] = max(0, min(100, float(result['score'])))
+    return result
+
+
+def _parse_json_array(content: str) -> List[Dict]:
+    """Extract a JSON array from a raw LLM response"""
+    try:
+        # json_mode (and most well-behaved replies) return bare JSON
+        return _json_loads(content)
+    except ValueError:
+        json_match = _JSON_ARR_RE.search(content)
+        if not json_match:
+            raise ValueError("No JSON array found")
+        return _json_loads(json_match.group())
+
+
+def _call_and_parse_json(llm: ChatOpenAI, messages: List, parser):
+    """Send messages to the LLM and parse the JSON payload out of the reply"""
+    if _circuit_open():
+        raise RuntimeError("XAI circuit breaker open - failing fast to fallback")
+    try:
+        response = llm.predict_messages(messages)
+    except Exception:
+        _record_llm_failure()
+        raise
+    _record_llm_success()
+    return parser(response.content.strip())
+
+
+async def _acall_and_parse_json(llm: ChatOpenAI, messages: List, parser):
+    """Async counterpart of _call_and_parse_json (rate-limited by the shared semaphore)"""
+    if _circuit_open():
+        raise RuntimeError("XAI circuit breaker open - failing fast to fallback")
+    try:
+        async with _LLM_SEMAPHORE:
+            response = await llm.apredict_messages(messages)
+    except Exception:
+        _record_llm_failure()
+        raise
+    _record_llm_success()
+    return parser(response.content.strip())
 
 
 def ats_score(resume_text: str, jd_text: str) -> Dict:
     """
     Score resume match to job description using Grok-3 AI.
-    
+
     Args:
         resume_text: Full text of candidate's resume
         jd_text: Job description text with title, requirements, and skills
-    
+
     Returns:
         {
             "score": 85,  # Match score out of 100
@@ -30,96 +380,125 @@ def ats_score(resume_text: str, jd_text: str) -> Dict:
         }
     """
     try:
-        # Initialize Grok-3 model via XAI API (OpenAI-compatible)
-        api_key = os.getenv("XAI_API_KEY") or os.getenv("OPENAI_API_KEY", "dummy-key")
-        base_url = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-        
-        llm = ChatOpenAI(
-            model="grok-beta",  # Grok-3 model
-            openai_api_key=api_key,
-            openai_api_base=base_url,
-            temperature=0.3,
-            max_tokens=1000
+        return _call_and_parse_json(
+            _make_llm(temperature=0.3, max_tokens=1000, json_mode=True),
+            _ats_messages(resume_text, jd_text),
+            _parse_ats_response
         )
-        
-        # Create ATS scoring prompt
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert Applicant Tracking System (ATS) analyzer. 
-Your job is to objectively score how well a candidate's resume matches a job description.
-
-Analyze the resume against the job description and provide:
-1. A match score from 0-100 (be realistic and fair)
-2. A detailed explanation of why the candidate is or isn't a good match
-3. List of matched skills found in both resume and JD
-4. List of missing critical skills from the JD not found in resume
-5. Overall recommendation: "Strong Match" (80+), "Good Match" (60-79), "Moderate Match" (40-59), or "Weak Match" (<40)
-
-Consider:
-- Technical skills match
-- Experience level and years
-- Education relevance
-- Domain expertise
-- Specific tools/frameworks mentioned
-- Project complexity and scale
-
-Return ONLY a valid JSON object with this exact structure:
-{
-  "score": <number 0-100>,
-  "explanation": "<detailed analysis>",
-  "matched_skills": ["skill1", "skill2"],
-  "missing_skills": ["skill3", "skill4"],
-  "recommendation": "<Strong Match|Good Match|Moderate Match|Weak Match>"
-}"""),
-            ("user", """Job Description:
-{jd_text}
-
----
-
-Candidate Resume:
-{resume_text}
+    except Exception as e:
+        print(f"⚠️ ATS scoring error: {e}")
+        # Fallback to keyword-based scoring
+        return _fallback_ats_score(resume_text, jd_text)
 
----
 
-Analyze this match and return ONLY the JSON object with no additional text.""")
-        ])
-        
-        # Format and send to Grok-3
-        messages = prompt.format_messages(
-            jd_text=jd_text[:3000],  # Limit JD length
-            resume_text=resume_text[:4000]  # Limit resume length
+async def ats_score_async(resume_text: str, jd_text: str) -> Dict:
+    """Async variant of ats_score - safe to gather with other generators"""
+    try:
+        return await _acall_and_parse_json(
+            _make_llm(temperature=0.3, max_tokens=1000, json_mode=True),
+            _ats_messages(resume_text, jd_text),
+            _parse_ats_response
         )
-        
-        try:
-            response = llm.predict_messages(messages)
-            result_text = response.content.strip()
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                
-                # Validate required fields
-                required_fields = ['score', 'explanation', 'matched_skills', 'missing_skills', 'recommendation']
-                if all(field in result for field in required_fields):
-                    # Ensure score is within bounds
-                    result['score'] = max(0, min(100, float(result['score'])))
-                    return result
-                else:
-                    raise ValueError("Missing required fields in AI response")
-            else:
-                raise ValueError("No JSON found in AI response")
-                
-        except Exception as llm_error:
-            print(f"⚠️ Grok-3 API error: {llm_error}")
-            # Fallback to keyword-based scoring
-            return _fallback_ats_score(resume_text, jd_text)
-            
     except Exception as e:
         print(f"⚠️ ATS scoring error: {e}")
-        # Ultimate fallback
         return _fallback_ats_score(resume_text, jd_text)
 
 
+async def ats_score_stream(resume_text: str, jd_text: str):
+    """
+    Stream the ATS scoring response token-by-token as Grok generates it.
+    Yields raw content chunks; callers accumulate the buffer and parse the
+    JSON at stream end (e.g. via _parse_ats_response). Downstream consumers
+    see "score" arrive before "explanation" finishes generating.
+    If the API fails before the first token, yields the fallback result as
+    one JSON chunk; a mid-stream failure re-raises instead - appending a
+    fallback blob after real chunks would make the accumulated buffer
+    unparseable, so consumers must be told to discard it.
+    """
+    if _circuit_open():
+        yield json.dumps(_fallback_ats_score(resume_text, jd_text))
+        return
+
+    emitted = False
+    try:
+        llm = _make_llm(temperature=0.3, max_tokens=1000, streaming=True, json_mode=True)
+        messages = _ats_messages(resume_text, jd_text)
+        async with _LLM_SEMAPHORE:
+            async for chunk in llm.astream(messages):
+                if chunk.content:
+                    emitted = True
+                yield chunk.content
+    except Exception as e:
+        print(f"⚠️ Grok-3 streaming error: {e}")
+        _record_llm_failure()
+        if emitted:
+            raise
+        yield json.dumps(_fallback_ats_score(resume_text, jd_text))
+
+
+async def ats_score_batch_async(resume_texts: List[str], jd_text: str) -> List[Dict]:
+    """
+    Score many resumes against one JD in a single concurrent batch.
+    Requests are pipelined over the shared HTTP pool via llm.abatch
+    instead of N serial round-trips to Grok.
+    """
+    if _circuit_open():
+        return _fallback_ats_score_batch(resume_texts, jd_text)
+
+    llm = _make_llm(temperature=0.3, max_tokens=1000, json_mode=True)
+    messages_list = [_ats_messages(resume_text, jd_text) for resume_text in resume_texts]
+
+    try:
+        responses = await llm.abatch(
+            messages_list,
+            config={"max_concurrency": _ATS_MAX_CONCURRENCY}
+        )
+    except Exception as llm_error:
+        print(f"⚠️ Grok-3 batch API error: {llm_error}")
+        _record_llm_failure()
+        return _fallback_ats_score_batch(resume_texts, jd_text)
+    _record_llm_success()
+
+    results = []
+    for resume_text, response in zip(resume_texts, responses):
+        try:
+            results.append(_parse_ats_response(response.content.strip()))
+        except Exception as parse_error:
+            print(f"⚠️ ATS batch parse error: {parse_error}")
+            results.append(_fallback_ats_score(resume_text, jd_text))
+    return results
+
+
+def ats_score_batch(resume_texts: List[str], jd_text: str) -> List[Dict]:
+    """Sync wrapper around ats_score_batch_async for non-async callers"""
+    return asyncio.run(ats_score_batch_async(resume_texts, jd_text))
+
+
+def _fallback_ats_score_batch(resume_texts: List[str], jd_text: str) -> List[Dict]:
+    """
+    Keyword-score a whole batch when the AI path is unavailable.
+    The scans are CPU-bound and independent, so large batches are spread
+    across a process pool; small ones stay in-process where fork/spawn
+    overhead would dominate.
+
+    NumPy-vectorized matching (boolean skill matrices) was evaluated here
+    and rejected: with skills packed into per-text integer bitmasks the
+    matched/missing algebra is already one CPU op per candidate, and
+    profiling shows the keyword scan - not the set math - dominates, so a
+    numpy dependency would not move the needle.
+    """
+    if len(resume_texts) < 32:
+        return [_fallback_ats_score(resume_text, jd_text) for resume_text in resume_texts]
+
+    import multiprocessing
+    with multiprocessing.Pool() as pool:
+        return pool.starmap(
+            _fallback_ats_score,
+            [(resume_text, jd_text) for resume_text in resume_texts],
+            chunksize=8
+        )
+
+
 def _fallback_ats_score(resume_text: str, jd_text: str) -> Dict:
     """
     Fallback ATS scoring using keyword matching when AI is unavailable.
@@ -127,47 +506,38 @@ def _fallback_ats_score(resume_text: str, jd_text: str) -> Dict:
     """
     resume_lower = resume_text.lower()
     jd_lower = jd_text.lower()
-    
-    # Extract potential skills from JD (common technical terms)
-    common_skills = [
-        'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
-        'fastapi', 'django', 'flask', 'express', 'spring',
-        'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
-        'git', 'ci/cd', 'jenkins', 'github actions',
-        'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-        'rest api', 'graphql', 'microservices', 'agile', 'scrum'
-    ]
-    
-    # Find skills mentioned in JD
-    jd_skills = [skill for skill in common_skills if skill in jd_lower]
-    
-    # Find matched skills in resume
-    matched_skills = [skill for skill in jd_skills if skill in resume_lower]
-    missing_skills = [skill for skill in jd_skills if skill not in resume_lower]
-    
+
+    # Single-pass keyword scan of both texts
+    resume_found = _scan_keywords(resume_lower)
+    jd_found = _scan_keywords(jd_lower)
+
+    # Matched/missing skills as bitwise ops over the skill masks
+    jd_mask = jd_found["skill_mask"]
+    matched_mask = resume_found["skill_mask"] & jd_mask
+    missing_mask = jd_mask & ~resume_found["skill_mask"]
+
+    matched_skills = _skills_from_mask(matched_mask)
+    missing_skills = _skills_from_mask(missing_mask)
+
     # Calculate base score
-    if len(jd_skills) > 0:
-        skill_match_score = (len(matched_skills) / len(jd_skills)) * 100
+    total_count = jd_mask.bit_count()
+    matched_count = matched_mask.bit_count()
+    if total_count > 0:
+        skill_match_score = (matched_count / total_count) * 100
     else:
         skill_match_score = 50  # Default if no specific skills found
-    
+
     # Boost score for experience indicators
-    experience_keywords = ['years', 'experience', 'led', 'managed', 'developed', 'built', 'designed']
-    experience_matches = sum(1 for kw in experience_keywords if kw in resume_lower)
+    experience_matches = len(resume_found["experience"])
     experience_boost = min(15, experience_matches * 3)
-    
+
     # Education boost
-    education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'computer science']
-    education_boost = 10 if any(kw in resume_lower for kw in education_keywords) else 0
-    
+    education_boost = 10 if resume_found["education"] else 0
+
     # Calculate final score
     final_score = min(100, skill_match_score + experience_boost + education_boost)
-    
+
     # Generate explanation
-    matched_count = len(matched_skills)
-    total_count = len(jd_skills)
-    
     if final_score >= 80:
         recommendation = "Strong Match"
         explanation = f"Excellent match! Found {matched_count} out of {total_count} required skills in resume. Candidate demonstrates strong relevant experience and qualifications."
@@ -180,13 +550,13 @@ def _fallback_ats_score(resume_text: str, jd_text: str) -> Dict:
     else:
         recommendation = "Weak Match"
         explanation = f"Limited match with only {matched_count} out of {total_count} required skills found. Significant skill gaps exist for this role."
-    
+
     # Add detail about missing skills
     if missing_skills:
         explanation += f" Missing skills include: {', '.join(missing_skills[:5])}."
-    
+
     explanation += " (Note: This is a basic keyword analysis. For more accurate scoring, configure XAI_API_KEY for Grok-3 AI analysis.)"
-    
+
     return {
         "score": round(final_score, 1),
         "explanation": explanation,
@@ -196,68 +566,78 @@ def _fallback_ats_score(resume_text: str, jd_text: str) -> Dict:
     }
 
 
+# Generator system prompts are static so the provider's automatic prompt
+# caching can reuse the KV-cache for the shared prefix across calls; all
+# per-request detail travels in the (small) user message instead
+_INTERVIEW_SYSTEM_PROMPT = SystemMessage(content="""You generate interview questions for job positions.
+Return ONLY a JSON array of questions with this structure:
+[
+  {"question_id": 1, "question_text": "...", "category": "technical"},
+  {"question_id": 2, "question_text": "...", "category": "behavioral"}
+]
+
+Categories: technical, behavioral, problem-solving, communication""")
+
+
+def _interview_messages(job_title: str, skills: List[str], language: str, count: int) -> List:
+    """Build the interview question generation prompt messages"""
+    return [
+        _INTERVIEW_SYSTEM_PROMPT,
+        HumanMessage(content=f"""Generate {count} interview questions for a {job_title} position.
+Skills to assess: {', '.join(skills)}
+Language: {language}""")
+    ]
+
+
+@_ttl_cache()
+def _generate_interview_questions_llm(job_title: str, skills: List[str], language: str, count: int) -> List[Dict]:
+    """LLM generation only - failures raise before the cache stores anything,
+    so a transient API error can't pin fallback questions for the TTL"""
+    return _call_and_parse_json(
+        _make_llm(temperature=0.7, max_tokens=2000),
+        _interview_messages(job_title, skills, language, count),
+        _parse_json_array
+    )
+
+
 def generate_interview_questions(job_title: str, skills: List[str], language: str = "en", count: int = 10) -> List[Dict]:
     """
     Generate interview questions using Grok-3 AI.
-    
+
     Args:
         job_title: Job title/position
         skills: List of required skills
         language: Language code (en, es, fr, hi, zh)
         count: Number of questions to generate
-    
+
     Returns:
         List of {"question_id": 1, "question_text": "...", "category": "technical"}
     """
     try:
-        api_key = os.getenv("XAI_API_KEY") or os.getenv("OPENAI_API_KEY", "dummy-key")
-        base_url = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-        
-        llm = ChatOpenAI(
-            model="grok-beta",
-            openai_api_key=api_key,
-            openai_api_base=base_url,
-            temperature=0.7,
-            max_tokens=2000
-        )
-        
-        # Create prompt for question generation
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f"""Generate {count} interview questions for a {job_title} position.
-Skills to assess: {', '.join(skills)}
-Language: {language}
+        return _generate_interview_questions_llm(job_title, skills, language, count)
+    except Exception as e:
+        print(f"⚠️ Question generation error: {e}")
+        # Fallback to default questions
+        return _fallback_interview_questions(job_title, skills, count)
 
-Return ONLY a JSON array of questions with this structure:
-[
-  {{"question_id": 1, "question_text": "...", "category": "technical"}},
-  {{"question_id": 2, "question_text": "...", "category": "behavioral"}}
-]
 
-Categories: technical, behavioral, problem-solving, communication"""),
-            ("user", f"Generate {count} interview questions for {job_title}.")
-        ])
-        
-        messages = prompt.format_messages()
-        response = llm.predict_messages(messages)
-        
-        # Parse JSON
-        json_match = re.search(r'\[.*\]', response.content, re.DOTALL)
-        if json_match:
-            questions = json.loads(json_match.group())
-            return questions
-        else:
-            raise ValueError("No JSON array found")
-            
+async def generate_interview_questions_async(job_title: str, skills: List[str], language: str = "en", count: int = 10) -> List[Dict]:
+    """Async variant of generate_interview_questions"""
+    try:
+        return await _acall_and_parse_json(
+            _make_llm(temperature=0.7, max_tokens=2000),
+            _interview_messages(job_title, skills, language, count),
+            _parse_json_array
+        )
     except Exception as e:
         print(f"⚠️ Question generation error: {e}")
-        # Fallback to default questions
         return _fallback_interview_questions(job_title, skills, count)
 
 
 def _fallback_interview_questions(job_title: str, skills: List[str], count: int = 10) -> List[Dict]:
     """Fallback interview questions when AI is unavailable."""
     questions = []
-    
+
     # Technical questions based on skills
     for i, skill in enumerate(skills[:4], 1):
         questions.append({
@@ -265,7 +645,7 @@ def _fallback_interview_questions(job_title: str, skills: List[str], count: int
             "question_text": f"Can you describe your experience with {skill} and provide an example of a project where you used it?",
             "category": "technical"
         })
-    
+
     # Generic behavioral questions
     behavioral = [
         "Tell me about a challenging project you worked on and how you overcame obstacles.",
@@ -275,184 +655,202 @@ def _fallback_interview_questions(job_title: str, skills: List[str], count: int
         "Tell me about a time you had to learn a new technology quickly.",
         "How do you approach debugging complex issues in your code?"
     ]
-    
+
     for i, q in enumerate(behavioral[:count-len(questions)], len(questions)+1):
         questions.append({
             "question_id": i,
             "question_text": q,
             "category": "behavioral"
         })
-    
+
     return questions[:count]
 
 
+_BEHAVIORAL_SYSTEM_PROMPT = SystemMessage(content="""You are an expert HR interviewer. Generate STAR-method behavioral questions specific to the job description, starting with "Tell me about a time..." or "Describe a situation...". Assess leadership, teamwork, problem-solving, stress management and conflict resolution.
+Return ONLY a JSON array:
+[{"question_id": 1, "question_text": "Tell me about a time you...", "category": "behavioral"}]""")
+
+
+def _behavioral_messages(jd_text: str, count: int) -> List:
+    """Build the behavioral question generation prompt messages"""
+    return [
+        _BEHAVIORAL_SYSTEM_PROMPT,
+        HumanMessage(content=f"""Job Description:
+{_truncate_to_tokens(jd_text, _BEHAVIORAL_JD_TOKEN_BUDGET)}
+
+Generate {count} behavioral interview questions.""")
+    ]
+
+
+def _fallback_behavioral_questions(count: int) -> List[Dict]:
+    """Fallback behavioral questions when AI is unavailable."""
+    return [
+        {
+            "question_id": i + 1,
+            "question_text": q,
+            "category": "behavioral"
+        }
+        for i, q in enumerate([
+            "Tell me about a time you handled a stressful situation at work and how you managed it.",
+            "Describe a situation where you had to work with a difficult team member. How did you handle it?",
+            "Tell me about a time you failed and what you learned from the experience.",
+            "Describe a situation where you had to meet a tight deadline. What was your approach?",
+            "Tell me about a time you showed leadership even when you weren't in a leadership role."
+        ][:count])
+    ]
+
+
 def generate_behavioral_questions(jd_text: str, count: int = 5) -> List[Dict]:
     """
     Generate behavioral interview questions based on job description using Grok-3.
-    
+
     Args:
         jd_text: Full job description text
         count: Number of behavioral questions to generate
-    
+
     Returns:
         List of behavioral questions with situational focus
     """
     try:
-        api_key = os.getenv("XAI_API_KEY") or os.getenv("OPENAI_API_KEY", "dummy-key")
-        base_url = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-        
-        llm = ChatOpenAI(
-            model="grok-beta",
-            openai_api_key=api_key,
-            openai_api_base=base_url,
-            temperature=0.8,
-            max_tokens=1500
+        return _call_and_parse_json(
+            _make_llm(temperature=0.8, max_tokens=1500),
+            _behavioral_messages(jd_text, count),
+            _parse_json_array
         )
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f"""You are an expert HR interviewer. Generate {count} behavioral interview questions based on the job description.
+    except Exception as e:
+        print(f"⚠️ Behavioral question generation error: {e}")
+        # Fallback questions
+        return _fallback_behavioral_questions(count)
+
 
-Use the STAR method framework (Situation, Task, Action, Result).
+async def generate_behavioral_questions_async(jd_text: str, count: int = 5) -> List[Dict]:
+    """Async variant of generate_behavioral_questions"""
+    try:
+        return await _acall_and_parse_json(
+            _make_llm(temperature=0.8, max_tokens=1500),
+            _behavioral_messages(jd_text, count),
+            _parse_json_array
+        )
+    except Exception as e:
+        print(f"⚠️ Behavioral question generation error: {e}")
+        return _fallback_behavioral_questions(count)
 
-Questions should:
-- Start with "Tell me about a time..." or "Describe a situation..."
-- Focus on real scenarios relevant to the job requirements
-- Assess soft skills: leadership, teamwork, problem-solving, stress management, conflict resolution
-- Be specific to the role's challenges and responsibilities
 
+_CODING_SYSTEM_PROMPT = SystemMessage(content="""You are an expert coding interview problem creator (easy: basic loops/strings, medium: two-sum/binary-search class, hard: DP/graphs/system design).
 Return ONLY a JSON array:
-[
-  {{"question_id": 1, "question_text": "Tell me about a time you...", "category": "behavioral"}},
-  {{"question_id": 2, "question_text": "Describe a situation where...", "category": "behavioral"}}
-]"""),
-            ("user", f"""Job Description:
-{jd_text[:2000]}
+[{"problem_id": 1, "title": "...", "description": "<with examples and constraints>", "difficulty": "<difficulty>", "language": "<language>", "starter_code": "def solution():\\n    pass", "test_cases": [{"input": "5", "expected_output": "120"}]}]""")
 
-Generate {count} behavioral interview questions.""")
-        ])
-        
-        messages = prompt.format_messages()
-        response = llm.predict_messages(messages)
-        
-        # Parse JSON
-        json_match = re.search(r'\[.*\]', response.content, re.DOTALL)
-        if json_match:
-            questions = json.loads(json_match.group())
-            return questions
-        else:
-            raise ValueError("No JSON array found")
-            
-    except Exception as e:
-        print(f"⚠️ Behavioral question generation error: {e}")
-        # Fallback questions
-        return [
-            {
-                "question_id": i + 1,
-                "question_text": q,
-                "category": "behavioral"
-            }
-            for i, q in enumerate([
-                "Tell me about a time you handled a stressful situation at work and how you managed it.",
-                "Describe a situation where you had to work with a difficult team member. How did you handle it?",
-                "Tell me about a time you failed and what you learned from the experience.",
-                "Describe a situation where you had to meet a tight deadline. What was your approach?",
-                "Tell me about a time you showed leadership even when you weren't in a leadership role."
-            ][:count])
-        ]
+
+def _coding_messages(skills: List[str], difficulty: str, count: int) -> List:
+    """Build the coding problem generation prompt messages"""
+    # Map skills to primary language
+    language_map = {
+        "python": "python3",
+        "java": "java",
+        "javascript": "nodejs",
+        "c++": "cpp17",
+        "react": "nodejs",
+        "node.js": "nodejs",
+        "springboot": "java"
+    }
+
+    primary_skill = skills[0].lower() if skills else "python"
+    language = language_map.get(primary_skill, "python3")
+
+    return [
+        _CODING_SYSTEM_PROMPT,
+        HumanMessage(content=f"Generate {count} {difficulty} coding problems for {', '.join(skills)}. Set language to \"{language}\".")
+    ]
+
+
+@_ttl_cache()
+def _generate_coding_problems_llm(skills: List[str], difficulty: str, count: int) -> List[Dict]:
+    """LLM generation only - failures raise before the cache stores anything"""
+    return _call_and_parse_json(
+        _make_llm(temperature=0.7, max_tokens=2500),
+        _coding_messages(skills, difficulty, count),
+        _parse_json_array
+    )
 
 
 def generate_coding_problems(skills: List[str], difficulty: str = "medium", count: int = 3) -> List[Dict]:
     """
     Generate coding problems based on skills using Grok-3 AI.
-    
+
     Args:
         skills: List of technical skills to test (e.g., ["Python", "Algorithms", "React"])
         difficulty: Problem difficulty - "easy", "medium", or "hard"
         count: Number of problems to generate
-    
+
     Returns:
         List of coding problems with title, description, starter code, test cases
     """
     try:
-        api_key = os.getenv("XAI_API_KEY") or os.getenv("OPENAI_API_KEY", "dummy-key")
-        base_url = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-        
-        llm = ChatOpenAI(
-            model="grok-beta",
-            openai_api_key=api_key,
-            openai_api_base=base_url,
-            temperature=0.7,
-            max_tokens=2500
-        )
-        
-        # Map skills to primary language
-        language_map = {
-            "python": "python3",
-            "java": "java",
-            "javascript": "nodejs",
-            "c++": "cpp17",
-            "react": "nodejs",
-            "node.js": "nodejs",
-            "springboot": "java"
-        }
-        
-        primary_skill = skills[0].lower() if skills else "python"
-        language = language_map.get(primary_skill, "python3")
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f"""You are an expert coding interview problem creator. Generate {count} coding problems for a {difficulty} level assessment.
-
-Skills to test: {', '.join(skills)}
-Difficulty: {difficulty}
-
-For {difficulty} level:
-- easy: FizzBuzz, palindrome, reverse string, sum array, basic loops
-- medium: Two-sum, valid parentheses, binary search, linked list operations
-- hard: Dynamic programming, graph algorithms, system design
-
-Return ONLY a JSON array with this exact structure:
-[
-  {{
-    "problem_id": 1,
-    "title": "Problem Title",
-    "description": "Detailed problem description with examples and constraints",
-    "difficulty": "{difficulty}",
-    "language": "{language}",
-    "starter_code": "def solution():\\n    # Write your code here\\n    pass",
-    "test_cases": [
-      {{"input": "5", "expected_output": "120"}},
-      {{"input": "3", "expected_output": "6"}}
-    ]
-  }}
-]
-
-Make problems relevant to: {', '.join(skills)}"""),
-            ("user", f"Generate {count} {difficulty} coding problems for {', '.join(skills)}.")
-        ])
-        
-        messages = prompt.format_messages()
-        response = llm.predict_messages(messages)
-        
-        # Parse JSON
-        json_match = re.search(r'\[.*\]', response.content, re.DOTALL)
-        if json_match:
-            problems = json.loads(json_match.group())
-            return problems
-        else:
-            raise ValueError("No JSON array found")
-            
+        return _generate_coding_problems_llm(skills, difficulty, count)
     except Exception as e:
         print(f"⚠️ Coding problem generation error: {e}")
         # Fallback to default problems
         return _fallback_coding_problems(skills, difficulty, count)
 
 
+async def generate_coding_problems_async(skills: List[str], difficulty: str = "medium", count: int = 3) -> List[Dict]:
+    """Async variant of generate_coding_problems"""
+    try:
+        return await _acall_and_parse_json(
+            _make_llm(temperature=0.7, max_tokens=2500),
+            _coding_messages(skills, difficulty, count),
+            _parse_json_array
+        )
+    except Exception as e:
+        print(f"⚠️ Coding problem generation error: {e}")
+        return _fallback_coding_problems(skills, difficulty, count)
+
+
+@functools.cache
+def _load_fallback_templates() -> Dict:
+    """
+    Load the fallback problem bank (coding + stress-test templates) from
+    data/fallback_problems.json. The bank used to live here as a large
+    nested literal that was compiled into bytecode and materialized on
+    every import; the JSON blob is parsed once by the C decoder, and only
+    when a fallback is first needed.
+    """
+    data_path = os.path.join(os.path.dirname(__file__), "data", "fallback_problems.json")
+    with open(data_path, "rb") as f:
+        return _json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=16)
+def _fallback_coding_problem_set(language: str, difficulty: str, count: int) -> tuple:
+    """
+    Build the (language, difficulty, count) fallback problem set once and
+    memoize it - the output is identical for identical inputs, so repeat
+    fallback calls become an O(1) lookup instead of dict/list construction.
+    """
+    templates = _load_fallback_templates()["coding"]
+    lang_templates = templates.get(language, templates["python3"])
+    template = lang_templates.get(difficulty, lang_templates.get("medium", lang_templates["easy"]))
+
+    return tuple(
+        {
+            "problem_id": i + 1,
+            "title": template["title"] + (f" - Variant {i+1}" if i > 0 else ""),
+            "description": template["description"],
+            "difficulty": difficulty,
+            "language": language,
+            "starter_code": template["starter_code"],
+            "test_cases": template["test_cases"]
+        }
+        for i in range(count)
+    )
+
+
 def _fallback_coding_problems(skills: List[str], difficulty: str = "medium", count: int = 3) -> List[Dict]:
     """Fallback coding problems when AI is unavailable."""
-    
+
     # Determine language from skills
     primary_skill = skills[0].lower() if skills else "python"
-    
+
     language_map = {
         "python": "python3",
         "java": "java",
@@ -462,186 +860,40 @@ def _fallback_coding_problems(skills: List[str], difficulty: str = "medium", cou
         "node.js": "nodejs"
     }
     language = language_map.get(primary_skill, "python3")
-    
-    # Language-specific templates
-    templates = {
-        "python3": {
-            "easy": {
-                "title": "FizzBuzz",
-                "description": "Write a function that prints numbers from 1 to n. For multiples of 3, print 'Fizz', for multiples of 5, print 'Buzz', and for multiples of both, print 'FizzBuzz'.\n\nExample:\nInput: n = 15\nOutput: 1, 2, Fizz, 4, Buzz, Fizz, 7, 8, Fizz, Buzz, 11, Fizz, 13, 14, FizzBuzz",
-                "starter_code": "def fizzbuzz(n):\n    # Write your code here\n    pass\n\n# Test\nprint(fizzbuzz(15))",
-                "test_cases": [
-                    {"input": "15", "expected_output": "1, 2, Fizz, 4, Buzz, Fizz, 7, 8, Fizz, Buzz, 11, Fizz, 13, 14, FizzBuzz"},
-                    {"input": "5", "expected_output": "1, 2, Fizz, 4, Buzz"}
-                ]
-            },
-            "medium": {
-                "title": "Two Sum",
-                "description": "Given an array of integers and a target sum, return indices of two numbers that add up to the target.\n\nExample:\nInput: nums = [2, 7, 11, 15], target = 9\nOutput: [0, 1]\nExplanation: nums[0] + nums[1] = 2 + 7 = 9",
-                "starter_code": "def two_sum(nums, target):\n    # Write your code here\n    pass\n\n# Test\nprint(two_sum([2, 7, 11, 15], 9))",
-                "test_cases": [
-                    {"input": "[2, 7, 11, 15], 9", "expected_output": "[0, 1]"},
-                    {"input": "[3, 2, 4], 6", "expected_output": "[1, 2]"}
-                ]
-            },
-            "hard": {
-                "title": "Valid Parentheses",
-                "description": "Given a string containing just the characters '(', ')', '{', '}', '[' and ']', determine if the input string is valid. Opening brackets must be closed by the same type in correct order.\n\nExample:\nInput: '({[]})'\nOutput: True",
-                "starter_code": "def is_valid(s):\n    # Write your code here\n    pass\n\n# Test\nprint(is_valid('({[]})'))",
-                "test_cases": [
-                    {"input": "({[]})", "expected_output": "True"},
-                    {"input": "([)]", "expected_output": "False"}
-                ]
-            }
-        },
-        "java": {
-            "easy": {
-                "title": "Reverse String",
-                "description": "Write a function to reverse a string.\n\nExample:\nInput: 'hello'\nOutput: 'olleh'",
-                "starter_code": "public class Solution {\n    public static String reverse(String s) {\n        // Write your code here\n        return \"\";\n    }\n    \n    public static void main(String[] args) {\n        System.out.println(reverse(\"hello\"));\n    }\n}",
-                "test_cases": [
-                    {"input": "hello", "expected_output": "olleh"},
-                    {"input": "world", "expected_output": "dlrow"}
-                ]
-            }
-        },
-        "nodejs": {
-            "easy": {
-                "title": "Array Sum",
-                "description": "Write a function that returns the sum of all numbers in an array.\n\nExample:\nInput: [1, 2, 3, 4, 5]\nOutput: 15",
-                "starter_code": "function sumArray(arr) {\n    // Write your code here\n}\n\n// Test\nconsole.log(sumArray([1, 2, 3, 4, 5]));",
-                "test_cases": [
-                    {"input": "[1, 2, 3, 4, 5]", "expected_output": "15"},
-                    {"input": "[10, 20, 30]", "expected_output": "60"}
-                ]
-            }
-        }
-    }
-    
-    # Get template for language and difficulty
-    lang_templates = templates.get(language, templates["python3"])
-    template = lang_templates.get(difficulty, lang_templates.get("medium", lang_templates["easy"]))
-    
-    # Generate problems
-    problems = []
-    for i in range(count):
-        problems.append({
-            "problem_id": i + 1,
-            "title": template["title"] + (f" - Variant {i+1}" if i > 0 else ""),
-            "description": template["description"],
-            "difficulty": difficulty,
-            "language": language,
-            "starter_code": template["starter_code"],
-            "test_cases": template["test_cases"]
-        })
-    
-    return problems
 
+    # Shallow-copy the cached problem dicts so callers can't mutate shared state
+    return [dict(problem) for problem in _fallback_coding_problem_set(language, difficulty, count)]
 
-def generate_stress_test(experience_level: str, skills: List[str] = None, count: int = 3) -> Dict:
-    """
-    Generate timed stress test with DSA problems based on candidate experience level.
-    
-    Args:
-        experience_level: "junior", "mid", "senior" (or years: <2, 2-5, 5+)
-        skills: Optional list of skills to focus on
-        count: Number of problems (default 3)
-    
-    Returns:
-        {
-            "difficulty": "hard",
-            "time_limit_minutes": 45,
-            "problems": [...],
-            "instructions": "Complete within time limit..."
-        }
-    """
-    try:
-        # Map experience to difficulty
-        experience_map = {
-            "junior": {"difficulty": "easy", "time_limit": 20},
-            "mid": {"difficulty": "medium", "time_limit": 30},
-            "senior": {"difficulty": "hard", "time_limit": 45},
-            "entry": {"difficulty": "easy", "time_limit": 20},
-            "intermediate": {"difficulty": "medium", "time_limit": 30},
-            "advanced": {"difficulty": "hard", "time_limit": 45}
-        }
-        
-        # Default to mid-level if unknown
-        config = experience_map.get(experience_level.lower(), experience_map["mid"])
-        difficulty = config["difficulty"]
-        time_limit = config["time_limit"]
-        
-        # Use Grok-3 to generate LeetCode-style problems
-        api_key = os.getenv("XAI_API_KEY") or os.getenv("OPENAI_API_KEY", "dummy-key")
-        base_url = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
-        
-        llm = ChatOpenAI(
-            model="grok-beta",
-            openai_api_key=api_key,
-            openai_api_base=base_url,
-            temperature=0.7,
-            max_tokens=3000
-        )
-        
-        skill_focus = ', '.join(skills) if skills else "Data Structures and Algorithms"
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f"""You are an expert at creating LeetCode-style DSA (Data Structures & Algorithms) problems for technical interviews.
-
-Generate {count} {difficulty} level DSA problems for a {experience_level} level candidate.
-Focus areas: {skill_focus}
-
-Problem types by difficulty:
-- EASY: Two Sum, Palindrome, Reverse String, Valid Parentheses, Merge Sorted Arrays
-- MEDIUM: Binary Search, Linked List Cycle, Longest Substring, Valid BST, Clone Graph
-- HARD: Merge K Sorted Lists, Trapping Rain Water, Word Ladder, Serialize Tree, LRU Cache
-
-Each problem should:
-1. Be a classic DSA problem (similar to LeetCode)
-2. Include time/space complexity hints
-3. Have clear examples
-4. Include edge cases in test cases
-5. Have appropriate time expectations ({difficulty} level)
 
+# Map experience to difficulty
+_EXPERIENCE_MAP = {
+    "junior": {"difficulty": "easy", "time_limit": 20},
+    "mid": {"difficulty": "medium", "time_limit": 30},
+    "senior": {"difficulty": "hard", "time_limit": 45},
+    "entry": {"difficulty": "easy", "time_limit": 20},
+    "intermediate": {"difficulty": "medium", "time_limit": 30},
+    "advanced": {"difficulty": "hard", "time_limit": 45}
+}
+
+
+_STRESS_SYSTEM_PROMPT = SystemMessage(content="""You create classic LeetCode-style DSA problems for technical interviews. Include clear examples, constraints, edge-case test cases and complexity hints.
 Return ONLY a JSON array:
-[
-  {{
-    "problem_id": 1,
-    "title": "Two Sum",
-    "description": "Given an array of integers nums and target, return indices of two numbers that add up to target.\\n\\nExample 1:\\nInput: nums = [2,7,11,15], target = 9\\nOutput: [0,1]\\n\\nConstraints:\\n- 2 <= nums.length <= 10^4\\n- Each input has exactly one solution",
-    "difficulty": "{difficulty}",
-    "language": "python3",
-    "time_complexity_hint": "O(n)",
-    "space_complexity_hint": "O(n)",
-    "estimated_time_minutes": 15,
-    "starter_code": "def twoSum(nums, target):\\n    # Write your solution here\\n    pass\\n\\n# Test\\nprint(twoSum([2,7,11,15], 9))",
-    "test_cases": [
-      {{"input": "[2,7,11,15], 9", "expected_output": "[0, 1]"}},
-      {{"input": "[3,2,4], 6", "expected_output": "[1, 2]"}}
+[{"problem_id": 1, "title": "Two Sum", "description": "<with examples and constraints>", "difficulty": "<difficulty>", "language": "python3", "time_complexity_hint": "O(n)", "space_complexity_hint": "O(n)", "estimated_time_minutes": 15, "starter_code": "def twoSum(nums, target):\\n    pass", "test_cases": [{"input": "[2,7,11,15], 9", "expected_output": "[0, 1]"}]}]""")
+
+
+def _stress_messages(experience_level: str, skill_focus: str, difficulty: str, count: int) -> List:
+    """Build the stress test generation prompt messages"""
+    return [
+        _STRESS_SYSTEM_PROMPT,
+        HumanMessage(content=f"Generate {count} {difficulty} DSA problems for a {experience_level} level candidate focusing on {skill_focus}.")
     ]
-  }}
-]"""),
-            ("user", f"Generate {count} {difficulty} DSA problems for {experience_level} level focusing on {skill_focus}.")
-        ])
-        
-        messages = prompt.format_messages()
-        response = llm.predict_messages(messages)
-        
-        # Parse JSON
-        json_match = re.search(r'\[.*\]', response.content, re.DOTALL)
-        if json_match:
-            problems = json.loads(json_match.group())
-        else:
-            raise ValueError("No JSON found in response")
-            
-    except Exception as e:
-        print(f"⚠️ Stress test generation error: {e}")
-        # Fallback to template problems
-        problems = _fallback_stress_test_problems(difficulty, count)
-    
+
+
+def _stress_test_payload(problems: List[Dict], difficulty: str, time_limit: int, experience_level: str, count: int) -> Dict:
+    """Assemble the final stress test response dict"""
     # Calculate total time estimate
     total_time = sum(p.get("estimated_time_minutes", time_limit // count) for p in problems)
-    
+
     return {
         "difficulty": difficulty,
         "time_limit_minutes": time_limit,
@@ -665,137 +917,194 @@ Good luck! 🚀""",
     }
 
 
-def _fallback_stress_test_problems(difficulty: str, count: int = 3) -> List[Dict]:
-    """Fallback stress test problems when AI is unavailable."""
-    
-    templates = {
-        "easy": [
-            {
-                "problem_id": 1,
-                "title": "Two Sum",
-                "description": """Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target.
-
-You may assume that each input would have exactly one solution, and you may not use the same element twice.
-
-Example 1:
-Input: nums = [2,7,11,15], target = 9
-Output: [0,1]
-Explanation: nums[0] + nums[1] == 9, so we return [0, 1]
-
-Example 2:
-Input: nums = [3,2,4], target = 6
-Output: [1,2]
-
-Constraints:
-- 2 <= nums.length <= 10^4
-- -10^9 <= nums[i] <= 10^9
-- Only one valid answer exists""",
-                "difficulty": "easy",
-                "language": "python3",
-                "time_complexity_hint": "O(n)",
-                "space_complexity_hint": "O(n)",
-                "estimated_time_minutes": 8,
-                "starter_code": "def twoSum(nums, target):\n    # Write your solution here\n    pass\n\n# Test\nprint(twoSum([2,7,11,15], 9))",
-                "test_cases": [
-                    {"input": "[2,7,11,15], 9", "expected_output": "[0, 1]"},
-                    {"input": "[3,2,4], 6", "expected_output": "[1, 2]"},
-                    {"input": "[3,3], 6", "expected_output": "[0, 1]"}
-                ]
-            },
-            {
-                "problem_id": 2,
-                "title": "Valid Palindrome",
-                "description": """A phrase is a palindrome if, after converting all uppercase letters into lowercase and removing all non-alphanumeric characters, it reads the same forward and backward.
-
-Given a string s, return true if it is a palindrome, or false otherwise.
-
-Example 1:
-Input: s = "A man, a plan, a canal: Panama"
-Output: true
-
-Example 2:
-Input: s = "race a car"
-Output: false
-
-Constraints:
-- 1 <= s.length <= 2 * 10^5
-- s consists only of printable ASCII characters""",
-                "difficulty": "easy",
-                "language": "python3",
-                "time_complexity_hint": "O(n)",
-                "space_complexity_hint": "O(1)",
-                "estimated_time_minutes": 6,
-                "starter_code": "def isPalindrome(s):\n    # Write your solution here\n    pass\n\n# Test\nprint(isPalindrome('A man, a plan, a canal: Panama'))",
-                "test_cases": [
-                    {"input": "A man, a plan, a canal: Panama", "expected_output": "True"},
-                    {"input": "race a car", "expected_output": "False"}
-                ]
-            }
-        ],
-        "medium": [
-            {
-                "problem_id": 1,
-                "title": "Longest Substring Without Repeating Characters",
-                "description": """Given a string s, find the length of the longest substring without repeating characters.
-
-Example 1:
-Input: s = "abcabcbb"
-Output: 3
-Explanation: The answer is "abc", with length 3.
-
-Example 2:
-Input: s = "bbbbb"
-Output: 1
-Explanation: The answer is "b", with length 1.
-
-Constraints:
-- 0 <= s.length <= 5 * 10^4
-- s consists of English letters, digits, symbols and spaces""",
-                "difficulty": "medium",
-                "language": "python3",
-                "time_complexity_hint": "O(n)",
-                "space_complexity_hint": "O(min(m,n))",
-                "estimated_time_minutes": 12,
-                "starter_code": "def lengthOfLongestSubstring(s):\n    # Write your solution here\n    pass\n\n# Test\nprint(lengthOfLongestSubstring('abcabcbb'))",
-                "test_cases": [
-                    {"input": "abcabcbb", "expected_output": "3"},
-                    {"input": "bbbbb", "expected_output": "1"},
-                    {"input": "pwwkew", "expected_output": "3"}
-                ]
-            }
-        ],
-        "hard": [
-            {
-                "problem_id": 1,
-                "title": "Trapping Rain Water",
-                "description": """Given n non-negative integers representing an elevation map where the width of each bar is 1, compute how much water it can trap after raining.
-
-Example 1:
-Input: height = [0,1,0,2,1,0,1,3,2,1,2,1]
-Output: 6
-Explanation: The above elevation map traps 6 units of rain water.
-
-Example 2:
-Input: height = [4,2,0,3,2,5]
-Output: 9
-
-Constraints:
-- n == height.length
-- 1 <= n <= 2 * 10^4
-- 0 <= height[i] <= 10^5""",
-                "difficulty": "hard",
-                "language": "python3",
-                "time_complexity_hint": "O(n)",
-                "space_complexity_hint": "O(1)",
-                "estimated_time_minutes": 20,
-                "starter_code": "def trap(height):\n    # Write your solution here\n    pass\n\n# Test\nprint(trap([0,1,0,2,1,0,1,3,2,1,2,1]))",
-                "test_cases": [
-                    {"input": "[0,1,0,2,1,0,1,3,2,1,2,1]", "expected_output": "6"},
-                    {"input": "[4,2,0,3,2,5]", "expected_output": "9"}
-                ]
-            }
-        ]
+@_ttl_cache()
+def _generate_stress_problems_llm(experience_level: str, skill_focus: str, difficulty: str, count: int) -> List[Dict]:
+    """LLM generation only - failures raise before the cache stores anything"""
+    return _call_and_parse_json(
+        _make_llm(temperature=0.7, max_tokens=3000),
+        _stress_messages(experience_level, skill_focus, difficulty, count),
+        _parse_json_array
+    )
+
+
+def generate_stress_test(experience_level: str, skills: List[str] = None, count: int = 3) -> Dict:
+    """
+    Generate timed stress test with DSA problems based on candidate experience level.
+
+    Args:
+        experience_level: "junior", "mid", "senior" (or years: <2, 2-5, 5+)
+        skills: Optional list of skills to focus on
+        count: Number of problems (default 3)
+
+    Returns:
+        {
+            "difficulty": "hard",
+            "time_limit_minutes": 45,
+            "problems": [...],
+            "instructions": "Complete within time limit..."
+        }
+    """
+    # Default to mid-level if unknown
+    config = _EXPERIENCE_MAP.get(experience_level.lower(), _EXPERIENCE_MAP["mid"])
+    difficulty = config["difficulty"]
+    time_limit = config["time_limit"]
+
+    skill_focus = ', '.join(skills) if skills else "Data Structures and Algorithms"
+
+    try:
+        # Use Grok-3 to generate LeetCode-style problems
+        problems = _generate_stress_problems_llm(experience_level, skill_focus, difficulty, count)
+    except Exception as e:
+        print(f"⚠️ Stress test generation error: {e}")
+        # Fallback to template problems
+        problems = _fallback_stress_test_problems(difficulty, count)
+
+    return _stress_test_payload(problems, difficulty, time_limit, experience_level, count)
+
+
+async def generate_stress_test_async(experience_level: str, skills: List[str] = None, count: int = 3) -> Dict:
+    """Async variant of generate_stress_test"""
+    config = _EXPERIENCE_MAP.get(experience_level.lower(), _EXPERIENCE_MAP["mid"])
+    difficulty = config["difficulty"]
+    time_limit = config["time_limit"]
+
+    skill_focus = ', '.join(skills) if skills else "Data Structures and Algorithms"
+
+    try:
+        problems = await _acall_and_parse_json(
+            _make_llm(temperature=0.7, max_tokens=3000),
+            _stress_messages(experience_level, skill_focus, difficulty, count),
+            _parse_json_array
+        )
+    except Exception as e:
+        print(f"⚠️ Stress test generation error: {e}")
+        problems = _fallback_stress_test_problems(difficulty, count)
+
+    return _stress_test_payload(problems, difficulty, time_limit, experience_level, count)
+
+
+async def build_full_interview(resume_text: str, jd_text: str, job_title: str, skills: List[str],
+                               language: str = "en", experience_level: str = "mid") -> Dict:
+    """
+    Run the full interview setup concurrently: ATS score + technical, behavioral,
+    coding, and stress test generation in a single asyncio.gather.
+    End-to-end latency is max(single call) instead of the sum of five calls.
+    """
+    ats, technical, behavioral, coding, stress = await asyncio.gather(
+        ats_score_async(resume_text, jd_text),
+        generate_interview_questions_async(job_title, skills, language, count=5),
+        generate_behavioral_questions_async(jd_text, count=5),
+        generate_coding_problems_async(skills, count=3),
+        generate_stress_test_async(experience_level, skills, count=3)
+    )
+    return {
+        "ats_score": ats,
+        "technical_questions": technical,
+        "behavioral_questions": behavioral,
+        "coding_problems": coding,
+        "stress_test": stress
+    }
+
+
+def build_full_interview_sync(resume_text: str, jd_text: str, job_title: str, skills: List[str],
+                              language: str = "en", experience_level: str = "mid") -> Dict:
+    """Sync wrapper around build_full_interview for non-async callers"""
+    return asyncio.run(build_full_interview(resume_text, jd_text, job_title, skills, language, experience_level))
+
+
+class TestCase(NamedTuple):
+    """
+    Packed test case. Every case has exactly these two fields, so a tuple
+    is far denser than a per-case dict and field access compiles to an
+    index lookup; the dict shape is only rebuilt at the API boundary.
+    """
+    input: str
+    expected_output: str
+
+
+@dataclass(frozen=True, slots=True)
+class ProblemTemplate:
+    """
+    One stress-test fallback problem. Slotted and frozen: no per-instance
+    __dict__ (a dict per problem times ~10 keys adds up across the bank)
+    and the shared records can't be mutated by callers.
+    """
+    problem_id: int
+    title: str
+    description: str
+    difficulty: str
+    language: str
+    time_complexity_hint: str
+    space_complexity_hint: str
+    estimated_time_minutes: int
+    starter_code: str
+    test_cases: tuple
+
+    def as_dict(self) -> Dict:
+        """Materialize the API-facing dict shape"""
+        return {
+            "problem_id": self.problem_id,
+            "title": self.title,
+            "description": self.description,
+            "difficulty": self.difficulty,
+            "language": self.language,
+            "time_complexity_hint": self.time_complexity_hint,
+            "space_complexity_hint": self.space_complexity_hint,
+            "estimated_time_minutes": self.estimated_time_minutes,
+            "starter_code": self.starter_code,
+            "test_cases": [
+                {"input": tc.input, "expected_output": tc.expected_output}
+                for tc in self.test_cases
+            ]
+        }
+
+
+@functools.cache
+def _load_stress_templates() -> Dict[str, tuple]:
+    """Hydrate the stress-test bank into tuples of ProblemTemplate records,
+    interning the small repeated strings so they're shared across records"""
+    return {
+        sys.intern(difficulty): tuple(
+            ProblemTemplate(
+                problem_id=p["problem_id"],
+                title=p["title"],
+                description=p["description"],
+                difficulty=sys.intern(p["difficulty"]),
+                language=sys.intern(p["language"]),
+                time_complexity_hint=sys.intern(p["time_complexity_hint"]),
+                space_complexity_hint=sys.intern(p["space_complexity_hint"]),
+                estimated_time_minutes=p["estimated_time_minutes"],
+                starter_code=p["starter_code"],
+                test_cases=tuple(
+                    TestCase(tc["input"], tc["expected_output"]) for tc in p["test_cases"]
+                )
+            )
+            for p in problems
+        )
+        for difficulty, problems in _load_fallback_templates()["stress"].items()
     }
-    
+
+
+@functools.lru_cache(maxsize=256)
+def _sampled_stress_problems(difficulty: str, count: int, seed: int) -> tuple:
+    """Deterministic seeded sample from the cached template bank - identical
+    seeded requests (e.g. re-renders) reuse the same tuple without re-sampling"""
+    templates = _load_stress_templates()
     available = templates.get(difficulty, templates["medium"])
-    return available[:count]
+    return tuple(random.Random(seed).sample(available, min(count, len(available))))
+
+
+def _fallback_stress_test_problems(difficulty: str, count: int = 3, seed: Optional[int] = None) -> List[Dict]:
+    """
+    Fallback stress test problems when AI is unavailable.
+    With a seed the sample is deterministic and memoized; without one the
+    selection is shuffled per call so repeat takers don't always get the
+    first N problems of the bank.
+    """
+    if seed is not None:
+        picked = _sampled_stress_problems(difficulty, count, seed)
+    else:
+        templates = _load_stress_templates()
+        available = templates.get(difficulty, templates["medium"])
+        picked = random.sample(available, min(count, len(available)))
+    return [problem.as_dict() for problem in picked]
@@ -1,19 +1,53 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
 from jose import JWTError, jwt
 from fastapi import HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import os
 import hashlib
+import pickle
 
-from models import User
+from models import User, UserRole
 
 # JWT Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here-change-me")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Precomputed once: jose re-derives the HMAC key from str input and walks
+# the algorithms list on every call, so hand it ready-made bytes + tuple
+SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+ALGORITHMS = (ALGORITHM,)
+
+# Optional Redis cache for the JWT -> User lookup: every authenticated
+# request otherwise costs one DB hit. Enabled only when REDIS_URL is set.
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+_REDIS_URL = os.getenv("REDIS_URL")
+_user_cache = aioredis.from_url(_REDIS_URL) if (aioredis and _REDIS_URL) else None
+_USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+
+
+class UserCtx(NamedTuple):
+    """
+    Immutable slice of User carried through a request when the cache is
+    active - tiny to pickle and immune to detached-instance problems.
+    Covers every field the endpoints read off the current user (audit
+    with `grep -oE '\\buser\\.[a-z_]+' main.py` when adding endpoints).
+    """
+    id: int
+    email: str
+    full_name: Optional[str]
+    role: UserRole
+    company_name: Optional[str]
+    created_at: datetime
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -37,14 +71,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> dict:
     """Decode and verify JWT token"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=ALGORITHMS)
         return payload
     except JWTError:
         raise HTTPException(
@@ -76,12 +110,37 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials, db) -> Use
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == user_id, User.email == email).first()
+    # Short-TTL cache hit skips the DB entirely
+    if _user_cache is not None:
+        try:
+            cached = await _user_cache.get(f"auth:user:{user_id}")
+            if cached:
+                user_ctx = pickle.loads(cached)
+                if user_ctx.email == email:
+                    return user_ctx
+        except Exception:
+            pass  # cache trouble must never block auth
+
+    # Works with both session types while endpoints migrate to get_async_db
+    if isinstance(db, AsyncSession):
+        result = await db.execute(select(User).where(User.id == user_id, User.email == email))
+        user = result.scalar_one_or_none()
+    else:
+        user = db.query(User).filter(User.id == user_id, User.email == email).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    if _user_cache is not None:
+        user_ctx = UserCtx(user.id, user.email, user.full_name, user.role,
+                           user.company_name, user.created_at)
+        try:
+            await _user_cache.setex(f"auth:user:{user_id}", _USER_CACHE_TTL, pickle.dumps(user_ctx))
+        except Exception:
+            pass
+        return user_ctx
+
     return user
@@ -2,11 +2,13 @@
 Database configuration and session management
 Supports both SQLite (development) and PostgreSQL (production)
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 import os
-from typing import Generator
+from typing import AsyncGenerator, Generator
+
+from models import Base
 
 # Database URL - supports both SQLite and PostgreSQL
 DATABASE_URL = os.getenv(
@@ -16,25 +18,94 @@ DATABASE_URL = os.getenv(
 
 # Handle SQLite-specific settings
 if DATABASE_URL.startswith("sqlite"):
+    # A real connection pool (instead of StaticPool's single shared
+    # connection) lets concurrent requests read in parallel; WAL mode
+    # below makes that safe
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        pool_size=10,
+        max_overflow=20,
         echo=os.getenv("SQL_ECHO", "false").lower() == "true"
     )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL allows concurrent readers alongside one writer; the rest trade
+        a little durability/memory for substantially fewer fsyncs and disk reads"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
 else:
-    # PostgreSQL settings
+    # PostgreSQL settings - sized so >15 concurrent DB-touching requests
+    # don't queue behind "QueuePool limit reached" timeouts. When fronted
+    # by PgBouncer, point DATABASE_URL at the bouncer port; the per-worker
+    # pool then multiplexes onto the shared bouncer pool.
     engine = create_engine(
         DATABASE_URL,
         pool_size=20,
-        max_overflow=40,
+        max_overflow=20,
+        pool_timeout=30,
         pool_pre_ping=True,
+        pool_recycle=1800,  # retire connections before NAT/firewall idle timeouts
         echo=os.getenv("SQL_ECHO", "false").lower() == "true"
     )
 
+# The engine is created at import, so under gunicorn/uvicorn preload every
+# forked worker inherits the parent's pooled sockets - shared fds corrupt
+# TLS sessions on PostgreSQL. Drop the inherited pool in each child
+# (close=False leaves the parent's sockets alone); connections are rebuilt
+# lazily on first use.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (aiosqlite / asyncpg) - endpoints that migrate to
+# Depends(get_async_db) yield the event loop during DB waits instead of
+# pinning it. The sync engine above stays for CLI scripts and endpoints
+# that haven't been converted yet.
+ASYNC_DATABASE_URL = (
+    DATABASE_URL
+    .replace("sqlite://", "sqlite+aiosqlite://")
+    .replace("postgresql://", "postgresql+asyncpg://")
+)
+
+if ASYNC_DATABASE_URL.startswith("sqlite"):
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true"
+    )
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_async_sqlite_pragmas(dbapi_connection, connection_record):
+        """Same pragma profile as the sync engine"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+else:
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=20,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        # asyncpg's server-side prepared statement cache breaks behind
+        # PgBouncer's transaction pooling; disable it
+        connect_args={"statement_cache_size": 0},
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true"
+    )
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -48,22 +119,55 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting an async database session
+    Use in FastAPI routes with Depends(get_async_db)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def init_db_async():
+    """Initialize database with all tables using the async engine"""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    print("✅ Database initialized successfully!")
+
+
 def init_db():
     """Initialize database with all tables"""
-    from models import Base
-    Base.metadata.create_all(bind=engine)
+    # create_all's default checkfirst reflects before every CREATE - two
+    # round trips per table. Reflect once instead: cold databases get pure
+    # DDL in one transaction, warm ones keep the per-table existence checks
+    # (to pick up newly added tables)
+    with engine.begin() as conn:
+        existing_tables = inspect(conn).get_table_names()
+        Base.metadata.create_all(bind=conn, checkfirst=bool(existing_tables))
     print("✅ Database initialized successfully!")
 
 
 def drop_db():
     """Drop all tables - USE WITH CAUTION!"""
-    from models import Base
     Base.metadata.drop_all(bind=engine)
     print("⚠️ All tables dropped!")
 
 
 def reset_db():
-    """Reset database - drop and recreate all tables"""
-    drop_db()
-    init_db()
+    """Reset database - drop and recreate all tables atomically"""
+    # One transaction for drop + create: a single commit/fsync, and no
+    # window where the schema is half-gone. Per-row FK validation is
+    # suspended for the bulk window (drop order stops mattering and any
+    # follow-up seeding skips O(rows) constraint checks), then restored
+    # before commit.
+    sqlite = DATABASE_URL.startswith("sqlite")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "PRAGMA foreign_keys=OFF" if sqlite else "SET session_replication_role='replica'"
+        )
+        Base.metadata.drop_all(bind=conn)
+        Base.metadata.create_all(bind=conn, checkfirst=False)
+        conn.exec_driver_sql(
+            "PRAGMA foreign_keys=ON" if sqlite else "SET session_replication_role='origin'"
+        )
     print("🔄 Database reset complete!")
@@ -78,7 +78,12 @@ class JobDescription(Base):
     employer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=False)
-    skills_required = Column(JSON, nullable=False)  # Array of required skills
+    # Array of required skills. A Postgres-only alternative - a generated
+    # text[] column with a GIN index so skill overlap runs in SQL - was
+    # evaluated and rejected while the default deployment is SQLite and
+    # schema changes go through create_all; the app-side matching is
+    # memoized instead (see resume_parser.calculate_ats_score_cached).
+    skills_required = Column(JSON, nullable=False)
     location = Column(String(255), nullable=True, index=True)
     salary_range = Column(String(100), nullable=True)
     salary_min = Column(Integer, nullable=True)
@@ -101,6 +106,10 @@ class JobDescription(Base):
         Index('idx_jd_employer_active', 'employer_id', 'is_active'),
         Index('idx_jd_location_active', 'location', 'is_active'),
         Index('idx_jd_created', 'created_at'),
+        # Hot list-endpoint paths: /api/jobs filters on is_active and pages
+        # by id/created_at; /api/employer/jobs sorts an employer's jobs
+        Index('idx_jd_active_created', 'is_active', 'created_at'),
+        Index('idx_jd_employer_created', 'employer_id', 'created_at'),
     )
     
     def __repr__(self):
@@ -231,6 +240,9 @@ class Match(Base):
         Index('idx_match_candidate_score', 'candidate_id', 'match_score'),
         Index('idx_match_status', 'status'),
         Index('idx_match_created', 'created_at'),
+        # One candidate applies to a job at most once; also turns the
+        # duplicate-application check in apply_to_job into an index probe
+        Index('idx_match_job_candidate', 'job_id', 'candidate_id', unique=True),
         CheckConstraint('match_score >= 0 AND match_score <= 100', name='check_match_score_range'),
     )
     
@@ -3,17 +3,29 @@ AI-powered resume parser using OpenAI
 Extracts skills, experience, education from resumes
 """
 
+import functools
 import json
 import re
 from typing import Dict, List
 import os
 
+# Experience patterns are matched against every resume - compile once
+_EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'),
+    re.compile(r'experience:\s*(\d+)\+?\s*years?'),
+    re.compile(r'(\d+)\s*years?\s*in\s*(?:software|development|engineering)')
+]
+
+_EDUCATION_KEYWORDS = ["bachelor", "master", "phd", "b.tech", "m.tech", "mba", "computer science", "engineering"]
+_CERT_KEYWORDS = ["certified", "certification", "aws certified", "azure certified", "google certified"]
+
+
 def parse_resume_text(resume_text: str) -> Dict:
     """
     Parse resume text and extract structured information
     Uses pattern matching and AI-like extraction
     """
-    
+
     result = {
         "skills": [],
         "experience_years": 0,
@@ -41,36 +53,22 @@ def parse_resume_text(resume_text: str) -> Dict:
             result["skills"].append(skill)
     
     # Extract experience years
-    experience_patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-        r'experience:\s*(\d+)\+?\s*years?',
-        r'(\d+)\s*years?\s*in\s*(?:software|development|engineering)'
-    ]
-    
     max_years = 0
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, text_lower)
-        for match in matches:
+    for pattern in _EXPERIENCE_PATTERNS:
+        for match in pattern.findall(text_lower):
             years = int(match) if isinstance(match, str) else int(match[0])
             max_years = max(max_years, years)
-    
+
     result["experience_years"] = max_years
-    
-    # Extract education
-    education_keywords = ["bachelor", "master", "phd", "b.tech", "m.tech", "mba", "computer science", "engineering"]
+
+    # Extract education + certifications in one pass over the lines
     lines = resume_text.split('\n')
     for line in lines:
         line_lower = line.lower()
-        if any(keyword in line_lower for keyword in education_keywords):
+        if not result["education"] and any(keyword in line_lower for keyword in _EDUCATION_KEYWORDS):
             if len(line.strip()) > 10:  # Avoid short lines
                 result["education"] = line.strip()
-                break
-    
-    # Extract certifications
-    cert_keywords = ["certified", "certification", "aws certified", "azure certified", "google certified"]
-    for line in lines:
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in cert_keywords):
+        if any(keyword in line_lower for keyword in _CERT_KEYWORDS):
             result["certifications"].append(line.strip())
     
     # Extract languages
@@ -94,28 +92,39 @@ def calculate_ats_score(candidate_skills: List[str], job_skills: List[str]) -> D
     
     if not job_skills:
         return {"score": 50, "matched_skills": [], "missing_skills": []}
-    
+
+    # Lowercase each skill exactly once; the old code re-lowered inside
+    # nested loops, making the comparison O(n^2) string allocations
     candidate_skills_lower = [s.lower() for s in candidate_skills]
+    candidate_set = set(candidate_skills_lower)
     job_skills_lower = [s.lower() for s in job_skills]
-    
-    # Find matched skills
+    job_set = set(job_skills_lower)
+
+    # Exact matches resolve with one hash lookup; only unmatched job
+    # skills pay the substring comparison loop that handles partial names
+    # ("node" vs "node.js"). A pure bitmask/popcount overlap was
+    # considered but can't express the substring semantics.
     matched = []
-    for job_skill in job_skills:
-        for candidate_skill in candidate_skills:
-            if job_skill.lower() == candidate_skill.lower() or \
-               job_skill.lower() in candidate_skill.lower() or \
-               candidate_skill.lower() in job_skill.lower():
+    matched_lower = set()
+    for job_skill, job_lower in zip(job_skills, job_skills_lower):
+        if job_lower in candidate_set:
+            matched.append(job_skill)
+            matched_lower.add(job_lower)
+            continue
+        for cand_lower in candidate_skills_lower:
+            if job_lower in cand_lower or cand_lower in job_lower:
                 matched.append(job_skill)
+                matched_lower.add(job_lower)
                 break
-    
+
     # Find missing skills
-    missing = [s for s in job_skills if s.lower() not in [m.lower() for m in matched]]
-    
+    missing = [s for s, s_lower in zip(job_skills, job_skills_lower) if s_lower not in matched_lower]
+
     # Calculate score
-    base_score = (len(matched) / len(job_skills)) * 100 if job_skills else 0
-    
+    base_score = (len(matched) / len(job_skills)) * 100
+
     # Bonus for having extra relevant skills
-    extra_skills = len([s for s in candidate_skills if s.lower() not in job_skills_lower])
+    extra_skills = sum(1 for s_lower in candidate_skills_lower if s_lower not in job_set)
     bonus = min(extra_skills * 2, 15)  # Max 15% bonus
     
     final_score = min(base_score + bonus, 100)
@@ -127,6 +136,27 @@ def calculate_ats_score(candidate_skills: List[str], job_skills: List[str]) -> D
         "extra_skills": extra_skills
     }
 
+@functools.lru_cache(maxsize=4096)
+def _cached_ats_score(candidate_key: tuple, job_key: tuple) -> Dict:
+    return calculate_ats_score(list(candidate_key), list(job_key))
+
+
+def calculate_ats_score_cached(candidate_skills: List[str], job_skills: List[str]) -> Dict:
+    """
+    Memoized front-end for calculate_ats_score.
+    Applications to a popular job re-score the same (candidate, job) skill
+    sets repeatedly; the LRU turns the repeat matching work into a dict
+    lookup. The skill lists are copied on the way out so callers can't
+    mutate the cached entry.
+    """
+    result = _cached_ats_score(tuple(candidate_skills), tuple(job_skills))
+    return {
+        **result,
+        "matched_skills": list(result["matched_skills"]),
+        "missing_skills": list(result["missing_skills"])
+    }
+
+
 def get_latest_simulation_score(db, job_id: int, candidate_id: int):
     """
     Get the latest simulation score for a candidate on a specific job